@@ -5,10 +5,12 @@ This module contains authentication endpoints including user registration,
 login, logout, and token verification using Zero-Knowledge Proofs.
 """
 
+import json
 import time
 from datetime import timedelta
+from typing import List
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from fastapi.responses import JSONResponse
 
 from app.api.auth.schemas import (
@@ -20,16 +22,24 @@ from app.api.auth.schemas import (
     ZKPKeyGenerationResponse,
     ZKPProofGenerationRequest,
     ZKPProofGenerationResponse,
-    ZKPProofSchnorr
+    ZKPProofSchnorr,
+    ZKPBatchOperation,
+    ZKPBatchVerifyItem,
+    ZKPCommitmentPrecomputeRequest
 )
 from app.core.dependencies import DatabaseDep, CurrentUser
-from app.services.auth import auth_service
+from app.core.exceptions import RateLimitExceededException
+from app.services.auth import auth_service, SESSION_ID_TTL_SECONDS
 from app.services.zkp import zkp_service
 from app.core.config import get_settings
 
 router = APIRouter()
 settings = get_settings()
 
+# Upper bound on sub-requests accepted by /utils/batch and proofs
+# accepted by /utils/verify-proof-batch
+MAX_BATCH_OPERATIONS = 32
+
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register_user(request: UserRegistrationRequest, db: DatabaseDep) -> JSONResponse:
@@ -146,6 +156,28 @@ async def logout_user(current_user: CurrentUser) -> JSONResponse:
     )
 
 
+@router.get("/session/new")
+async def new_auth_session(username: str) -> JSONResponse:
+    """
+    Issue a single-use session id for the given username.
+    
+    A proof for that user whose message is bound to this id (see
+    /utils/generate-proof) is accepted once by either /register or /login,
+    within the returned lifetime, so it cannot be replayed. A username may
+    hold at most MAX_SESSION_IDS_PER_USER (8) unused ids; further requests
+    get 429 until some are used or expire.
+    """
+    return JSONResponse(
+        content={
+            "success": True,
+            "data": {
+                "sid": auth_service.issue_session_id(username),
+                "expires_in": SESSION_ID_TTL_SECONDS
+            }
+        }
+    )
+
+
 # Utility endpoints for ZKP operations
 
 @router.post("/utils/generate-keypair")
@@ -173,6 +205,44 @@ async def generate_zkp_keypair(request: ZKPKeyGenerationRequest) -> JSONResponse
     )
 
 
+@router.post("/utils/precompute-commitments")
+async def precompute_zkp_commitments(request: ZKPCommitmentPrecomputeRequest, http_request: Request) -> JSONResponse:
+    """
+    Precompute Schnorr commitments for later proof generation.
+    
+    Pass a returned commitment_id to /utils/generate-proof to skip the
+    nonce scalar multiplication there. Each id is single-use, expires
+    after PRECOMPUTED_COMMITMENT_TTL_SECONDS (120 s) and is only valid on
+    the server process that issued it. Each client may hold at most
+    MAX_PRECOMPUTED_COMMITMENTS_PER_CALLER (64) unused ids; further
+    requests get 429 until some are used or expire.
+    
+    **WARNING: This is for development/testing only!**
+    """
+    caller = http_request.client.host if http_request.client else ""
+    try:
+        pairs = zkp_service.precompute_commitments(request.count, caller)
+    except ValueError as e:
+        raise RateLimitExceededException(str(e))
+    
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "ZKP commitments precomputed successfully",
+            "data": {
+                "commitments": [
+                    {
+                        "commitment_id": commitment_id,
+                        "commitment_x": hex(commitment.x()),
+                        "commitment_y": hex(commitment.y())
+                    }
+                    for commitment_id, commitment in pairs
+                ]
+            }
+        }
+    )
+
+
 @router.post("/utils/generate-proof")
 async def generate_zkp_proof(request: ZKPProofGenerationRequest) -> JSONResponse:
     """
@@ -185,17 +255,28 @@ async def generate_zkp_proof(request: ZKPProofGenerationRequest) -> JSONResponse
         # Parse private key
         private_key = int(request.private_key, 16) if request.private_key.startswith('0x') else int(request.private_key, 16)
         
-        # Create authentication message
-        timestamp = request.timestamp or int(time.time())
-        message = zkp_service.create_authentication_message(request.username, timestamp)
-        
-        # Generate proof
-        proof_data = zkp_service.create_proof(private_key, message)
+        # Create authentication message, bound to either the session id or a
+        # timestamp; echo back whichever one was signed
+        if request.session_id:
+            message = zkp_service.create_session_message(request.username, request.session_id)
+            binding = {"session_id": request.session_id}
+        else:
+            timestamp = request.timestamp or int(time.time())
+            message = zkp_service.create_authentication_message(request.username, timestamp)
+            binding = {"timestamp": timestamp}
         
-        # Get corresponding public key
+        # Derive the public key once and share it with proof generation
         public_key = private_key * zkp_service.generator
         public_key_hex = zkp_service._point_to_hex(public_key)
         
+        # Generate proof
+        proof_data = zkp_service.create_proof(
+            private_key,
+            message,
+            public_key=public_key,
+            commitment_id=request.commitment_id
+        )
+        
         return JSONResponse(
             content={
                 "success": True,
@@ -209,7 +290,7 @@ async def generate_zkp_proof(request: ZKPProofGenerationRequest) -> JSONResponse
                         "message": proof_data.message
                     },
                     "public_key": public_key_hex,
-                    "timestamp": timestamp,
+                    **binding,
                     "warning": "This is for testing only. Use secure client-side proof generation in production."
                 }
             }
@@ -227,6 +308,18 @@ async def generate_zkp_proof(request: ZKPProofGenerationRequest) -> JSONResponse
                 }
             }
         )
+    except KeyError:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "success": False,
+                "error": {
+                    "type": "ValidationError",
+                    "message": "Unknown, expired or already used commitment_id",
+                    "code": "VALIDATION_ERROR"
+                }
+            }
+        )
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -281,4 +374,149 @@ async def verify_zkp_proof_endpoint(
                     "code": "VERIFICATION_FAILED"
                 }
             }
-        ) 
\ No newline at end of file
+        )
+
+
+@router.post("/utils/batch")
+async def batch_zkp_utils(operations: List[ZKPBatchOperation]) -> JSONResponse:
+    """
+    Run several ZKP utility operations in one request.
+    
+    Each operation is dispatched to the matching utility endpoint and the
+    results are returned in the same order. Missing inputs are taken from
+    earlier operations in the batch, so generate-keypair, generate-proof
+    and verify-proof can be chained in a single round-trip.
+    
+    **WARNING: This is for development/testing only!**
+    """
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "success": False,
+                "error": {
+                    "type": "ValidationError",
+                    "message": f"A batch may contain at most {MAX_BATCH_OPERATIONS} operations",
+                    "code": "VALIDATION_ERROR"
+                }
+            }
+        )
+    
+    results = []
+    private_key = None
+    public_key = None
+    zkp_proof = None
+    
+    for operation in operations:
+        if operation.op == "generate-keypair":
+            response = await generate_zkp_keypair(ZKPKeyGenerationRequest(username=operation.username))
+        elif operation.op == "generate-proof":
+            response = await generate_zkp_proof(ZKPProofGenerationRequest(
+                private_key=operation.private_key or private_key or "",
+                username=operation.username,
+                timestamp=operation.timestamp,
+                commitment_id=operation.commitment_id,
+                session_id=operation.session_id
+            ))
+        else:
+            proof = operation.zkp_proof or zkp_proof
+            key = operation.public_key or public_key
+            if proof is None or key is None:
+                results.append({
+                    "status_code": status.HTTP_400_BAD_REQUEST,
+                    "success": False,
+                    "error": {
+                        "type": "ValidationError",
+                        "message": "verify-proof needs a proof and public key, or an earlier generate-proof in the batch",
+                        "code": "VALIDATION_ERROR"
+                    }
+                })
+                continue
+            response = await verify_zkp_proof_endpoint(zkp_proof=proof, public_key=key, username=operation.username)
+        
+        content = json.loads(response.body)
+        results.append({"status_code": response.status_code, **content})
+        
+        # Remember outputs for later operations in the batch
+        data = content.get("data", {})
+        if operation.op == "generate-keypair":
+            private_key = data["private_key"]
+            public_key = data["public_key"]
+        elif operation.op == "generate-proof" and content["success"]:
+            zkp_proof = ZKPProofSchnorr(**data["zkp_proof"])
+            public_key = data["public_key"]
+    
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "ZKP batch completed",
+            "data": {
+                "results": results
+            }
+        }
+    )
+
+
+@router.post("/utils/verify-proof-batch")
+async def verify_zkp_proof_batch_endpoint(items: List[ZKPBatchVerifyItem]) -> JSONResponse:
+    """
+    Verify several ZKP proofs for testing purposes.
+    
+    All proofs are checked together with one randomized multi-scalar
+    equation, which costs far less than verifying them one by one. Only
+    when that check fails are the proofs verified individually to report
+    which ones are invalid.
+    """
+    if len(items) > MAX_BATCH_OPERATIONS:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "success": False,
+                "error": {
+                    "type": "ValidationError",
+                    "message": f"A batch may contain at most {MAX_BATCH_OPERATIONS} proofs",
+                    "code": "VALIDATION_ERROR"
+                }
+            }
+        )
+    
+    try:
+        proofs = [item.zkp_proof for item in items]
+        public_keys = [item.public_key for item in items]
+        
+        if zkp_service.batch_verify_proofs(proofs, public_keys):
+            valid = [True] * len(items)
+        else:
+            valid = [zkp_service.verify_proof(proof, public_key) for proof, public_key in zip(proofs, public_keys)]
+        
+        return JSONResponse(
+            content={
+                "success": True,
+                "message": "ZKP batch verification completed",
+                "data": {
+                    "valid": all(valid),
+                    "results": [
+                        {
+                            "valid": is_valid,
+                            "public_key": item.public_key,
+                            "username": item.username,
+                            "proof_message": item.zkp_proof.message
+                        }
+                        for item, is_valid in zip(items, valid)
+                    ]
+                }
+            }
+        )
+    
+    except Exception as e:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "success": False,
+                "error": {
+                    "type": "VerificationError",
+                    "message": f"Proof verification failed: {str(e)}",
+                    "code": "VERIFICATION_FAILED"
+                }
+            }
+        )
@@ -6,7 +6,7 @@ operations including registration, login, and token verification.
 """
 
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 import re
@@ -171,9 +171,41 @@ class ZKPProofGenerationRequest(BaseModel):
     private_key: str = Field(..., description="Private key for proof generation")
     username: str = Field(..., description="Username for the message")
     timestamp: Optional[int] = Field(None, description="Timestamp for the message")
+    commitment_id: Optional[str] = Field(None, description="Id of a precomputed commitment to use")
+    session_id: Optional[str] = Field(None, description="Server-issued session id to bind the proof to (replaces timestamp)")
 
 
 class ZKPProofGenerationResponse(BaseModel):
     """Response model for ZKP proof generation."""
     zkp_proof: ZKPProofSchnorr = Field(..., description="Generated Schnorr proof")
-    public_key: str = Field(..., description="Corresponding public key") 
\ No newline at end of file
+    public_key: str = Field(..., description="Corresponding public key") 
+
+
+class ZKPBatchOperation(BaseModel):
+    """
+    One sub-request of a batched ZKP utility call.
+    
+    Fields left out of a generate-proof or verify-proof operation are taken
+    from the previous operations in the same batch, so keypair generation,
+    proof generation and verification can run in one round-trip.
+    """
+    op: Literal["generate-keypair", "generate-proof", "verify-proof"] = Field(..., description="Utility operation to run")
+    username: str = Field(..., description="Username for the operation")
+    private_key: Optional[str] = Field(None, description="Private key for generate-proof (defaults to the last keypair generated in the batch)")
+    timestamp: Optional[int] = Field(None, description="Timestamp for generate-proof")
+    commitment_id: Optional[str] = Field(None, description="Id of a precomputed commitment for generate-proof")
+    session_id: Optional[str] = Field(None, description="Server-issued session id to bind a generate-proof to (replaces timestamp)")
+    zkp_proof: Optional[ZKPProofSchnorr] = Field(None, description="Proof for verify-proof (defaults to the last proof generated in the batch)")
+    public_key: Optional[str] = Field(None, description="Public key for verify-proof (defaults to the key of the last proof generated in the batch)")
+
+
+class ZKPBatchVerifyItem(BaseModel):
+    """One proof to check in a batched verification call."""
+    zkp_proof: ZKPProofSchnorr = Field(..., description="Schnorr proof to verify")
+    public_key: str = Field(..., description="Public key the proof was made for")
+    username: str = Field(..., description="Username")
+
+
+class ZKPCommitmentPrecomputeRequest(BaseModel):
+    """Request model for precomputing Schnorr commitments (utility endpoint)."""
+    count: int = Field(..., ge=1, le=32, description="Number of commitments to precompute")
@@ -197,14 +197,20 @@ async def generic_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Health check endpoint
-@app.get("/health")
+# Health check endpoint; HEAD gives clients a bodiless reachability probe
+@app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
         "app": "ZKP File Sharing API",
-        "version": "0.1.0"
+        "version": "0.1.0",
+        "capabilities": [
+            "auth-utils-batch",
+            "verify-proof-batch",
+            "precompute-commitments",
+            "session-ids"
+        ]
     }
 
 
@@ -5,10 +5,11 @@ This module handles JWT token creation/verification, ZKP verification,
 and user authentication logic.
 """
 
+import secrets
 import uuid
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import structlog
 from jose import JWTError, jwt
@@ -19,22 +20,140 @@ from sqlalchemy import select
 from app.core.config import get_settings
 from app.core.exceptions import (
     AuthenticationFailedException,
+    RateLimitExceededException,
     UserNotFoundException,
     ZKPVerificationFailedException
 )
 from app.models.user import User
-from app.services.zkp import zkp_service, ZKPProofData
+from app.services.zkp import zkp_service, ZKPProofData, AUTH_MESSAGE_PREFIX, SESSION_MESSAGE_PREFIX
 
 
 logger = structlog.get_logger(__name__)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# How long an issued session id can be used to authenticate, and how many
+# unused ids are kept at once, overall and per username
+SESSION_ID_TTL_SECONDS = 300
+MAX_LIVE_SESSION_IDS = 4096
+MAX_SESSION_IDS_PER_USER = 8
+
+# How old the timestamp of a timestamp-bound ZKP message may be at login, and
+# how far ahead of the server clock it may run
+AUTH_MESSAGE_MAX_AGE_SECONDS = SESSION_ID_TTL_SECONDS
+AUTH_MESSAGE_MAX_CLOCK_SKEW_SECONDS = 30
+
 
 class AuthService:
     """Authentication service for user management and JWT operations."""
     
     def __init__(self):
         self.settings = get_settings()
+        
+        # Unused session ids mapped to (username, expiry time). Every id gets
+        # the same TTL, so insertion order is expiry order. Unused ids held by
+        # each username are counted separately
+        self._session_ids: Dict[str, Tuple[str, float]] = {}
+        self._session_ids_per_user: Dict[str, int] = {}
+    
+    def issue_session_id(self, username: str) -> str:
+        """
+        Issue a single-use session id for binding a user's ZKP to this server.
+        
+        Only expired ids are ever evicted; a username may hold at most
+        MAX_SESSION_IDS_PER_USER unused ids.
+        
+        Args:
+            username: Username the session id may be used for
+        
+        Returns:
+            New session id
+        
+        Raises:
+            RateLimitExceededException: If the username or the server has too
+                many unused session ids
+        """
+        now = time.time()
+        
+        # Drop expired ids from the front
+        while self._session_ids:
+            oldest_id = next(iter(self._session_ids))
+            if self._session_ids[oldest_id][1] > now:
+                break
+            self._release_session_id(oldest_id)
+        
+        if self._session_ids_per_user.get(username, 0) >= MAX_SESSION_IDS_PER_USER:
+            raise RateLimitExceededException("Too many unused session ids for this username")
+        if len(self._session_ids) >= MAX_LIVE_SESSION_IDS:
+            raise RateLimitExceededException("Too many unused session ids")
+        
+        session_id = secrets.token_hex(16)
+        self._session_ids[session_id] = (username, now + SESSION_ID_TTL_SECONDS)
+        self._session_ids_per_user[username] = self._session_ids_per_user.get(username, 0) + 1
+        return session_id
+    
+    def _release_session_id(self, session_id: str) -> Tuple[str, float]:
+        """Remove an issued session id and return its (username, expiry)."""
+        issued = self._session_ids.pop(session_id)
+        username = issued[0]
+        self._session_ids_per_user[username] -= 1
+        if not self._session_ids_per_user[username]:
+            del self._session_ids_per_user[username]
+        return issued
+    
+    def consume_session_id(self, message: str, username: str) -> bool:
+        """
+        Check and use up the session id a ZKP message is bound to.
+        
+        Args:
+            message: Proof message created with create_session_message
+            username: Username the proof must be for
+        
+        Returns:
+            True if the message names this user and a live, unused session id
+            that was issued for this user
+        """
+        try:
+            message_username, session_id = message[len(SESSION_MESSAGE_PREFIX):].rsplit(":", 1)
+        except ValueError:
+            return False
+        
+        if message_username != username:
+            return False
+        
+        # Only the user the id was issued to can use it up
+        issued = self._session_ids.get(session_id)
+        if issued is None or issued[0] != username:
+            return False
+        
+        _, expiry = self._release_session_id(session_id)
+        return expiry > time.time()
+    
+    def is_fresh_auth_message(self, message: str, *identifiers: str) -> bool:
+        """
+        Check that a timestamp-bound ZKP message is recent and names the user.
+        
+        Args:
+            message: Proof message created with create_authentication_message
+            identifiers: Names the message may carry (username or email)
+        
+        Returns:
+            True if the message names one of `identifiers` and its timestamp is
+            at most AUTH_MESSAGE_MAX_AGE_SECONDS old and not in the future
+            beyond AUTH_MESSAGE_MAX_CLOCK_SKEW_SECONDS
+        """
+        if not message.startswith(AUTH_MESSAGE_PREFIX):
+            return False
+        
+        try:
+            message_identifier, timestamp = message[len(AUTH_MESSAGE_PREFIX):].rsplit(":", 1)
+            age = time.time() - int(timestamp)
+        except ValueError:
+            return False
+        
+        return (
+            message_identifier in identifiers
+            and -AUTH_MESSAGE_MAX_CLOCK_SKEW_SECONDS <= age <= AUTH_MESSAGE_MAX_AGE_SECONDS
+        )
     
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """
@@ -188,6 +307,17 @@ class AuthService:
             logger.warning("ZKP verification failed", user_id=str(user.id), identifier=identifier)
             raise ZKPVerificationFailedException()
         
+        # A Schnorr proof must be bound either to a session id, which is only
+        # accepted once, or to a recent timestamp
+        message = zkp_proof.get("message") or ""
+        if message.startswith(SESSION_MESSAGE_PREFIX):
+            if not self.consume_session_id(message, user.username):
+                logger.warning("ZKP session id rejected", user_id=str(user.id), identifier=identifier)
+                raise ZKPVerificationFailedException("Session id is unknown, expired or already used")
+        elif message and not self.is_fresh_auth_message(message, user.username, user.email):
+            logger.warning("Stale or unbound ZKP message rejected", user_id=str(user.id), identifier=identifier)
+            raise ZKPVerificationFailedException("Proof message is stale or not bound to this user")
+        
         logger.info("User authenticated successfully", user_id=str(user.id), username=user.username)
         return user
     
@@ -230,6 +360,14 @@ class AuthService:
         if not self._validate_public_key_format(public_key):
             raise AuthenticationFailedException("Invalid public key format")
         
+        # A session-bound proof is used up here too, so it can't be replayed to
+        # /login. Only done once the account is known to be creatable, so a
+        # rejected registration leaves the session id usable
+        message = zkp_proof.get("message") or ""
+        if message.startswith(SESSION_MESSAGE_PREFIX) and not self.consume_session_id(message, username):
+            logger.warning("ZKP session id rejected during registration", username=username)
+            raise ZKPVerificationFailedException("Session id is unknown, expired or already used")
+        
         # Create new user
         user = User(
             username=username,
@@ -17,12 +17,13 @@ Schnorr Proof Protocol:
 
 import hashlib
 import secrets
-from typing import Dict, Any, Tuple, Optional
+import time
+from typing import Dict, Any, List, Tuple, Optional
 from dataclasses import dataclass
 
 import structlog
 from ecdsa import SECP256k1, ellipticcurve
-from ecdsa.ellipticcurve import Point
+from ecdsa.ellipticcurve import INFINITY, Point, PointJacobi
 from ecdsa.util import number_to_string, string_to_number
 
 logger = structlog.get_logger(__name__)
@@ -32,6 +33,17 @@ CURVE = SECP256k1
 GENERATOR = CURVE.generator
 ORDER = CURVE.order
 
+# Prefixes of authentication messages bound to a timestamp and to a
+# server-issued session id
+AUTH_MESSAGE_PREFIX = "ZKP_AUTH:"
+SESSION_MESSAGE_PREFIX = "ZKP_SESSION:"
+
+# Upper bound on precomputed commitments waiting to be used, overall and
+# per caller, and how long an unused one is kept
+MAX_PRECOMPUTED_COMMITMENTS = 1024
+MAX_PRECOMPUTED_COMMITMENTS_PER_CALLER = 64
+PRECOMPUTED_COMMITMENT_TTL_SECONDS = 120
+
 
 @dataclass
 class ZKPKeyPair:
@@ -58,6 +70,16 @@ class ZKPService:
         self.curve = CURVE
         self.generator = GENERATOR
         self.order = ORDER
+        
+        # Precomputed (nonce, commitment, expiry, caller) by commitment id; each
+        # is used once. Insertion order is expiry order, so the oldest entry is
+        # first. Unused commitments held by each caller are counted separately
+        self._precomputed: Dict[str, Tuple[int, Point, float, str]] = {}
+        self._precomputed_per_caller: Dict[str, int] = {}
+        
+        # ecdsa builds the fixed-base table for G lazily on the first
+        # multiplication; build it now so the first request doesn't pay for it
+        self.generator * 2
     
     def generate_keypair(self) -> ZKPKeyPair:
         """
@@ -83,7 +105,70 @@ class ZKPService:
             public_key_hex=public_key_hex
         )
     
-    def create_proof(self, private_key: int, message: str, challenge: Optional[str] = None) -> ZKPProofData:
+    def precompute_commitments(self, count: int, caller: str) -> List[Tuple[str, Point]]:
+        """
+        Precompute Schnorr commitments ahead of proof generation.
+        
+        The nonce scalar multiplication `R = r * G` is the bulk of
+        create_proof; doing it here leaves only hashing and one modular
+        multiplication for the proof itself. The nonces stay in this
+        process and each commitment id can be used exactly once, within
+        PRECOMPUTED_COMMITMENT_TTL_SECONDS. Only expired commitments are
+        ever evicted; a caller may hold at most
+        MAX_PRECOMPUTED_COMMITMENTS_PER_CALLER unused ones.
+        
+        Args:
+            count: Number of commitments to precompute
+            caller: Identifies the client the commitments are issued to
+        
+        Returns:
+            List of (commitment_id, commitment point) pairs
+        
+        Raises:
+            ValueError: If the caller or the shared pool has no room left
+        """
+        now = time.time()
+        
+        # Drop expired entries from the front
+        while self._precomputed:
+            oldest_id = next(iter(self._precomputed))
+            if self._precomputed[oldest_id][2] > now:
+                break
+            self._release_commitment(oldest_id)
+        
+        if self._precomputed_per_caller.get(caller, 0) + count > MAX_PRECOMPUTED_COMMITMENTS_PER_CALLER:
+            raise ValueError("Too many unused commitments for this caller")
+        if len(self._precomputed) + count > MAX_PRECOMPUTED_COMMITMENTS:
+            raise ValueError("Too many unused commitments")
+        
+        pairs = []
+        for _ in range(count):
+            nonce = secrets.randbelow(self.order)
+            commitment = nonce * self.generator
+            commitment_id = secrets.token_hex(16)
+            self._precomputed[commitment_id] = (nonce, commitment, now + PRECOMPUTED_COMMITMENT_TTL_SECONDS, caller)
+            pairs.append((commitment_id, commitment))
+        self._precomputed_per_caller[caller] = self._precomputed_per_caller.get(caller, 0) + count
+        
+        return pairs
+    
+    def _release_commitment(self, commitment_id: str) -> Tuple[int, Point, float, str]:
+        """Remove a precomputed commitment and return its entry."""
+        entry = self._precomputed.pop(commitment_id)
+        caller = entry[3]
+        self._precomputed_per_caller[caller] -= 1
+        if not self._precomputed_per_caller[caller]:
+            del self._precomputed_per_caller[caller]
+        return entry
+    
+    def create_proof(
+        self,
+        private_key: int,
+        message: str,
+        challenge: Optional[str] = None,
+        public_key: Optional[Point] = None,
+        commitment_id: Optional[str] = None
+    ) -> ZKPProofData:
         """
         Create a Schnorr proof of knowledge of private key.
         
@@ -91,18 +176,33 @@ class ZKPService:
             private_key: The private key to prove knowledge of
             message: Message to include in the proof (e.g., username, timestamp)
             challenge: Optional pre-computed challenge (for testing)
+            public_key: Optional public key point for `private_key`, if the
+                caller already has it (saves one scalar multiplication)
+            commitment_id: Optional id from precompute_commitments; its
+                nonce and commitment are used (and discarded) instead of
+                fresh ones
             
         Returns:
             ZKPProofData containing the proof components
-        """
-        # Generate random nonce
-        nonce = secrets.randbelow(self.order)
         
-        # Compute commitment R = r * G
-        commitment = nonce * self.generator
+        Raises:
+            KeyError: If `commitment_id` is unknown, expired or was already used
+        """
+        if commitment_id is not None:
+            # Pop so a nonce can never sign two messages
+            nonce, commitment, expiry, _ = self._release_commitment(commitment_id)
+            if expiry <= time.time():
+                raise KeyError(commitment_id)
+        else:
+            # Generate random nonce
+            nonce = secrets.randbelow(self.order)
+            
+            # Compute commitment R = r * G
+            commitment = nonce * self.generator
         
         # Compute public key P = x * G
-        public_key = private_key * self.generator
+        if public_key is None:
+            public_key = private_key * self.generator
         
         # Create challenge if not provided
         if challenge is None:
@@ -156,11 +256,16 @@ class ZKPService:
                 logger.warning("ZKP verification failed: invalid challenge")
                 return False
             
-            # Verify the main equation: s * G = R + c * P
-            left_side = response * self.generator
-            right_side = commitment + challenge * public_key
+            # Verify the main equation: s * G = R + c * P, rearranged to
+            # s * G + (-c) * P = R so both multiplications share one pass of
+            # doublings (Shamir's trick) in Jacobian coordinates
+            expected_commitment = self.generator.mul_add(
+                response,
+                PointJacobi.from_affine(public_key),
+                (-challenge) % self.order
+            )
             
-            if left_side.x() != right_side.x() or left_side.y() != right_side.y():
+            if expected_commitment != commitment:
                 logger.warning("ZKP verification failed: equation check failed")
                 return False
             
@@ -171,6 +276,104 @@ class ZKPService:
             logger.error("ZKP verification error", error=str(e))
             return False
     
+    def batch_verify_proofs(self, proofs: List[ZKPProofData], public_keys_hex: List[str]) -> bool:
+        """
+        Verify several Schnorr proofs at once.
+        
+        Each proof's Fiat-Shamir challenge is checked individually, then all
+        equations are folded into one random linear combination:
+        `(sum a_i * s_i) * G = sum a_i * R_i + sum (a_i * c_i) * P_i`, with
+        random 128-bit weights `a_i`. The right side is evaluated as a single
+        multi-scalar multiplication so the point doublings are shared across
+        the whole batch instead of being repeated per proof.
+        
+        Args:
+            proofs: The proofs to verify
+            public_keys_hex: Hex public keys, one per proof
+        
+        Returns:
+            True if every proof is valid, False if any proof is invalid.
+            A False result does not say which proof failed; use
+            verify_proof on each one to find it.
+        """
+        if len(proofs) != len(public_keys_hex):
+            raise ValueError("Each proof needs exactly one public key")
+        
+        if not proofs:
+            return True
+        
+        try:
+            combined_response = 0
+            terms = []
+            
+            for proof_data, public_key_hex in zip(proofs, public_keys_hex):
+                commitment = Point(
+                    self.curve.curve,
+                    int(proof_data.commitment_x, 16),
+                    int(proof_data.commitment_y, 16),
+                    self.order
+                )
+                response = int(proof_data.response, 16)
+                challenge = int(proof_data.challenge, 16)
+                public_key = self._hex_to_point(public_key_hex)
+                
+                expected_challenge = self._compute_challenge(commitment, public_key, proof_data.message)
+                if challenge != expected_challenge:
+                    logger.warning("ZKP batch verification failed: invalid challenge", message=proof_data.message)
+                    return False
+                
+                weight = secrets.randbelow(2**128 - 1) + 1
+                combined_response = (combined_response + weight * response) % self.order
+                terms.append((weight, PointJacobi.from_affine(commitment)))
+                terms.append(((weight * challenge) % self.order, PointJacobi.from_affine(public_key)))
+            
+            left_side = combined_response * self.generator
+            right_side = self._multi_scalar_mul(terms)
+            
+            if left_side != right_side:
+                logger.warning("ZKP batch verification failed: equation check failed", batch_size=len(proofs))
+                return False
+            
+            logger.info("ZKP batch verified successfully", batch_size=len(proofs))
+            return True
+        
+        except Exception as e:
+            logger.error("ZKP batch verification error", error=str(e))
+            return False
+    
+    def _multi_scalar_mul(self, terms: List[Tuple[int, PointJacobi]], window: int = 4) -> PointJacobi:
+        """
+        Compute `sum k_i * P_i` with Straus' interleaved windowed method.
+        
+        Args:
+            terms: (scalar, point) pairs
+            window: Window width in bits
+        
+        Returns:
+            The resulting point
+        """
+        # Small multiples 1*P .. (2^w - 1)*P for every point
+        tables = []
+        for _, point in terms:
+            multiples = [None, point]
+            for _ in range(2, 1 << window):
+                multiples.append(multiples[-1] + point)
+            tables.append(multiples)
+        
+        mask = (1 << window) - 1
+        top = max(scalar.bit_length() for scalar, _ in terms)
+        result = INFINITY
+        
+        for shift in range(top - top % window, -1, -window):
+            for _ in range(window):
+                result = result.double()
+            for (scalar, _), multiples in zip(terms, tables):
+                digit = (scalar >> shift) & mask
+                if digit:
+                    result = result + multiples[digit]
+        
+        return result
+    
     def _compute_challenge(self, commitment: Point, public_key: Point, message: str) -> int:
         """
         Compute the Fiat-Shamir challenge.
@@ -257,7 +460,20 @@ class ZKPService:
         Returns:
             Formatted authentication message
         """
-        return f"ZKP_AUTH:{username}:{timestamp}"
+        return f"{AUTH_MESSAGE_PREFIX}{username}:{timestamp}"
+    
+    def create_session_message(self, username: str, session_id: str) -> str:
+        """
+        Create an authentication message bound to a server-issued session id.
+        
+        Args:
+            username: Username of the authenticating user
+            session_id: Session id issued by the server
+        
+        Returns:
+            Formatted authentication message
+        """
+        return f"{SESSION_MESSAGE_PREFIX}{username}:{session_id}"
     
     def parse_legacy_proof(self, legacy_proof: Dict[str, Any]) -> Optional[ZKPProofData]:
         """
@@ -323,7 +539,7 @@ def create_demo_proof_for_user(username: str, public_key_hex: str) -> Dict[str,
     message = zkp_service.create_authentication_message(username, timestamp)
     
     # Create the proof
-    proof_data = zkp_service.create_proof(keypair.private_key, message)
+    proof_data = zkp_service.create_proof(keypair.private_key, message, public_key=keypair.public_key)
     
     # Return in format expected by the API
     return {
@@ -19,14 +19,19 @@ Research Paper References:
 """
 
 import time
+import hashlib
 import json
+import logging
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+import structlog
 from datetime import datetime
-from typing import Dict, List, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Tuple
 
 # Add app directory to path for imports
 sys.path.append('app')
@@ -39,53 +44,225 @@ except ImportError:
     zkp_service = None
     auth_service = None
 
-# Set style for better looking graphs
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# The graphs are raster PNGs; let Agg simplify and chunk long paths
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Number of proof/verify pairs sampled for the ZKP latency figures, and
+# the number each worker runs and discards first
+ZKP_SAMPLES = 1000
+ZKP_WARMUP = 100
+
+# Number of hash calls timed for the Fiat-Shamir challenge micro-benchmark
+HASH_SAMPLES = 10000
+
+# Proofs verified together for the batch verification figure, and the
+# smallest batch worth folding into one multi-scalar check
+BATCH_VERIFY_SAMPLES = 64
+BATCH_VERIFY_THRESHOLD = 2
+
+# Resolution of the saved graphs
+GRAPH_DPI = 150
+
+# Order of the methods in every graph, as keys into PerformanceAnalyzer.results
+_METHOD_KEYS = ('zkp', 'password_bcrypt', 'oauth2', 'fido2_webauthn', 'sms_otp')
+_METHODS = ('ZKP', 'Password+bcrypt', 'OAuth2', 'FIDO2/WebAuthn', 'SMS OTP')
+
+# One row per method, one column per compared metric
+_METRICS_DTYPE = np.dtype([
+    ('lat', 'f8'),
+    ('storage', 'i4'),
+    ('net', 'i4'),
+    ('priv', 'i4'),
+    ('bits', 'i4'),
+])
+
+
+# One row per sampled proof/verify cycle, as returned by _one_measurement
+_SAMPLE_DTYPE = np.dtype([
+    ('proof_ns', 'i8'),
+    ('verify_ns', 'i8'),
+    ('net', 'i4'),
+    ('storage', 'i4'),
+])
+
+# Baseline values from research papers, shared read-only by every analyzer
+_BASELINES = MappingProxyType({
+    'password_bcrypt': MappingProxyType({
+        'latency_ms': 180,  # Würsching et al. (2023)
+        'server_storage_bytes': 128,  # Hash + salt
+        'network_bytes': 200,  # Username + password hash
+        'privacy_score': 3,  # Based on Security Boulevard (2024)
+        'crypto_strength_bits': 80,  # Effective security against modern attacks
+        'reference': 'Würsching et al. (2023) - CHI Conference'
+    }),
+    'oauth2': MappingProxyType({
+        'latency_ms': 1200,  # Security Boulevard (2024)
+        'server_storage_bytes': 500,  # Token storage
+        'network_bytes': 1024,  # OAuth flow data
+        'privacy_score': 2,  # Third-party dependency
+        'crypto_strength_bits': 256,  # RSA-2048 or ECDSA-256
+        'reference': 'Security Boulevard (2024) - Authentication Framework'
+    }),
+    'fido2_webauthn': MappingProxyType({
+        'latency_ms': 350,  # Würsching et al. (2023)
+        'server_storage_bytes': 256,  # Public key + metadata
+        'network_bytes': 400,  # Assertion data
+        'privacy_score': 7,  # Hardware-based
+        'crypto_strength_bits': 256,  # ECDSA-256 or RSA-2048
+        'reference': 'Würsching et al. (2023) - CHI Conference'
+    }),
+    'sms_otp': MappingProxyType({
+        'latency_ms': 5000,  # Matzen et al. (2025)
+        'server_storage_bytes': 64,  # Phone number + temp token
+        'network_bytes': 150,  # SMS + verification
+        'privacy_score': 1,  # Phone number exposure
+        'crypto_strength_bits': 32,  # 6-digit OTP (~20 bits + timing)
+        'reference': 'Matzen et al. (2025) - Applied Sciences'
+    }),
+})
+
+# Bar labels for graph 5; every method's strength is a fixed value, ZKP's
+# being the 256-bit SECP256k1 curve
+_STRENGTH_LABELS = tuple(
+    f'{bits}-bit\n(2^-{bits})'
+    for bits in (256, *(_BASELINES[key]['crypto_strength_bits'] for key in _METHOD_KEYS[1:]))
+)
+
+
+# Privacy radar chart (graph 4): one axis per category, scores 0-10 with
+# 10 being best privacy. Each row repeats its first score to close the polygon
+_RADAR_CATEGORIES = ('Secrets\nRevealed', 'Third-party\nDependency', 'User\nControl', 'Data\nPermanence')
+_RADAR_ANGLES = np.concatenate([
+    np.linspace(0, 2 * np.pi, len(_RADAR_CATEGORIES), endpoint=False),
+    [0.0],
+])
+_RADAR_SERIES = (
+    ('ZKP (Ours)', '#2E8B57'),
+    ('Password+bcrypt', '#FF6B6B'),
+    ('OAuth2', '#4ECDC4'),
+    ('FIDO2/WebAuthn', '#45B7D1'),
+    ('SMS OTP', '#FFA07A'),
+)
+_RADAR_SCORES = np.array([
+    [10, 10, 10, 10, 10],  # Perfect privacy
+    [3, 8, 6, 4, 3],  # Passwords revealed, stored permanently
+    [2, 1, 3, 3, 2],  # Third-party sees everything
+    [8, 9, 8, 7, 8],  # Hardware-based, good privacy
+    [1, 2, 4, 2, 1],  # Phone numbers, SMS interception
+], dtype=np.int8)
+
+
+class Reference(NamedTuple):
+    """A research paper cited by the comparison"""
+    title: str
+    authors: str
+    venue: str
+    link: str
+    used_for: str
+
+
+_REFERENCES = (
+    Reference(
+        title='The Science of Guessing: Analyzing an Anonymized Corpus of 70 Million Passwords',
+        authors='Bonneau, J., Herley, C., Van Oorschot, P. C., & Stajano, F.',
+        venue='IEEE Symposium on Security and Privacy (2012)',
+        link='https://doi.org/10.1109/SP.2012.49',
+        used_for='Password authentication latency and security analysis'
+    ),
+    Reference(
+        title='Is FIDO2 the Kingslayer of User Authentication? A Comparative Usability Study',
+        authors='Lyastani, S. G., Schilling, M., Neumayr, M., Backes, M., & Bugiel, S.',
+        venue='ACM Conference on Computer and Communications Security (2020)',
+        link='https://doi.org/10.1145/3372297.3417292',
+        used_for='FIDO2/WebAuthn and OAuth2 performance metrics'
+    ),
+    Reference(
+        title='Multi-Factor Authentication: A Survey',
+        authors='Ometov, A., Bezzateev, S., Mäkitalo, N., Andreev, S., Mikkonen, T., & Koucheryavy, Y.',
+        venue='Sensors Journal (2021)',
+        link='https://doi.org/10.3390/s18051283',
+        used_for='SMS OTP and privacy scoring methodology'
+    ),
+    Reference(
+        title='Digital Identity Guidelines',
+        authors='Grassi, P. A., Garcia, M. E., & Fenton, J. L.',
+        venue='NIST Special Publication 800-63-3 (2017)',
+        link='https://doi.org/10.6028/NIST.SP.800-63-3',
+        used_for='Authentication security requirements and strength analysis'
+    ),
+)
+
+
+def _one_measurement(seed: int) -> Tuple[int, int, int, int]:
+    """Run one keypair/proof/verify cycle and return (proof_ns, verify_ns, network_bytes, storage_bytes)"""
+    # Generate test keypair
+    keypair = zkp_service.generate_keypair()
+    
+    # Measure proof generation time
+    start_ns = time.perf_counter_ns()
+    proof = zkp_service.create_proof(keypair.private_key, "test_user_auth")
+    proof_ns = time.perf_counter_ns() - start_ns
+    
+    # Measure proof verification time  
+    start_ns = time.perf_counter_ns()
+    is_valid = zkp_service.verify_proof(proof, keypair.public_key_hex)
+    verify_ns = time.perf_counter_ns() - start_ns
+    
+    storage_bytes = len(keypair.public_key_hex) // 2  # Hex to bytes
+    # json.dumps escapes to ASCII, so its length is already the byte count
+    network_bytes = len(json.dumps(vars(proof)))
+    
+    return proof_ns, verify_ns, network_bytes, storage_bytes
+
+
+def _quiet_service_logs():
+    """Keep the per-proof service logs out of the report output and timings"""
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+def _warm_up(iterations: int):
+    """Run and discard measurement cycles so a worker's caches are warm before sampling"""
+    # Pool workers started with spawn/forkserver re-import the services with
+    # the default structlog config, so silence them here as well as in main()
+    _quiet_service_logs()
+    
+    for seed in range(iterations):
+        _one_measurement(seed)
+
+
+def _hash_ns_per_proof(hash_fn, iterations: int = HASH_SAMPLES) -> float:
+    """Time the challenge hash alone: H(R.x || R.y || P.x || P.y || message), in ns per call"""
+    # Same input size as the challenge in ZKPService._compute_challenge
+    data = os.urandom(4 * 32) + "test_user_auth".encode('utf-8')
+    
+    start_ns = time.perf_counter_ns()
+    for _ in range(iterations):
+        hash_fn(data).digest()
+    return (time.perf_counter_ns() - start_ns) / iterations
+
+
+def verify_proof_batch(proofs: List, public_keys_hex: List[str]) -> List[bool]:
+    """Verify many proofs, returning one result per proof"""
+    # One combined check answers the common all-valid case; only when it
+    # fails are the proofs checked one by one to find the bad ones
+    if len(proofs) >= BATCH_VERIFY_THRESHOLD and zkp_service.batch_verify_proofs(proofs, public_keys_hex):
+        return [True] * len(proofs)
+    return [zkp_service.verify_proof(proof, public_key_hex) for proof, public_key_hex in zip(proofs, public_keys_hex)]
+
 
 class PerformanceAnalyzer:
     def __init__(self):
         self.results = {}
+        self.metrics = np.empty(0, dtype=_METRICS_DTYPE)
         self.research_data = self.load_research_baselines()
         
-    def load_research_baselines(self) -> Dict:
+    def load_research_baselines(self) -> Mapping:
         """Load baseline values from research papers"""
-        return {
-            'password_bcrypt': {
-                'latency_ms': 180,  # Würsching et al. (2023)
-                'server_storage_bytes': 128,  # Hash + salt
-                'network_bytes': 200,  # Username + password hash
-                'privacy_score': 3,  # Based on Security Boulevard (2024)
-                'crypto_strength_bits': 80,  # Effective security against modern attacks
-                'reference': 'Würsching et al. (2023) - CHI Conference'
-            },
-            'oauth2': {
-                'latency_ms': 1200,  # Security Boulevard (2024)
-                'server_storage_bytes': 500,  # Token storage
-                'network_bytes': 1024,  # OAuth flow data
-                'privacy_score': 2,  # Third-party dependency
-                'crypto_strength_bits': 256,  # RSA-2048 or ECDSA-256
-                'reference': 'Security Boulevard (2024) - Authentication Framework'
-            },
-            'fido2_webauthn': {
-                'latency_ms': 350,  # Würsching et al. (2023)
-                'server_storage_bytes': 256,  # Public key + metadata
-                'network_bytes': 400,  # Assertion data
-                'privacy_score': 7,  # Hardware-based
-                'crypto_strength_bits': 256,  # ECDSA-256 or RSA-2048
-                'reference': 'Würsching et al. (2023) - CHI Conference'
-            },
-            'sms_otp': {
-                'latency_ms': 5000,  # Matzen et al. (2025)
-                'server_storage_bytes': 64,  # Phone number + temp token
-                'network_bytes': 150,  # SMS + verification
-                'privacy_score': 1,  # Phone number exposure
-                'crypto_strength_bits': 32,  # 6-digit OTP (~20 bits + timing)
-                'reference': 'Matzen et al. (2025) - Applied Sciences'
-            }
-        }
+        return _BASELINES
 
-    def measure_zkp_performance(self) -> Dict:
+    def measure_zkp_performance(self, samples: int = ZKP_SAMPLES, warmup: int = ZKP_WARMUP) -> Dict:
         """Measure actual ZKP authentication performance"""
         print("📊 Measuring ZKP Authentication Performance...")
         
@@ -99,306 +276,273 @@ class PerformanceAnalyzer:
                 'crypto_strength_bits': 256,  # SECP256k1 is 256-bit curve
             }
         
-        # Actual measurements
+        # Actual measurements: proof/verify pairs are CPU-bound and independent,
+        # so spread them across all cores and take per-op medians
         results = {}
         
-        # Generate test keypair
-        keypair = zkp_service.generate_keypair()
-        
-        # Measure proof generation time
-        start_time = time.time()
-        proof = zkp_service.create_proof(keypair.private_key, "test_user_auth")
-        proof_time = (time.time() - start_time) * 1000
-        
-        # Measure proof verification time  
-        start_time = time.time()
-        is_valid = zkp_service.verify_proof(proof, keypair.public_key_hex)
-        verify_time = (time.time() - start_time) * 1000
-        
-        results['latency_ms'] = proof_time + verify_time
-        results['server_storage_bytes'] = len(keypair.public_key_hex.encode()) // 2  # Hex to bytes
-        results['network_bytes'] = len(json.dumps({
-            'commitment_x': proof.commitment_x,
-            'commitment_y': proof.commitment_y,
-            'response': proof.response,
-            'challenge': proof.challenge,
-            'message': proof.message
-        }).encode())
+        # The very first cycle pays one-off costs; report it separately
+        proof_ns, verify_ns, _, _ = _one_measurement(0)
+        results['cold_latency_ms'] = (proof_ns + verify_ns) / 1e6
+        
+        measurements = np.empty(samples, dtype=_SAMPLE_DTYPE)
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up, initargs=(warmup,)) as executor:
+            rows = executor.map(
+                _one_measurement, range(samples), chunksize=max(1, samples // (workers * 4))
+            )
+            for i, row in enumerate(rows):
+                measurements[i] = row
+        
+        results['latency_ms'] = float(np.median(measurements['proof_ns']) + np.median(measurements['verify_ns'])) / 1e6
+        results['server_storage_bytes'] = int(np.median(measurements['storage']))
+        results['network_bytes'] = int(np.median(measurements['net']))
         results['privacy_score'] = 10  # Zero knowledge proof
         results['crypto_strength_bits'] = 256  # SECP256k1 is 256-bit curve
         
+        # Per-proof cost of verifying a whole batch at once
+        keypairs = [zkp_service.generate_keypair() for _ in range(BATCH_VERIFY_SAMPLES)]
+        proofs = [
+            zkp_service.create_proof(keypair.private_key, "test_user_auth", public_key=keypair.public_key)
+            for keypair in keypairs
+        ]
+        start_ns = time.perf_counter_ns()
+        verify_proof_batch(proofs, [keypair.public_key_hex for keypair in keypairs])
+        results['batch_verify_ms_per_proof'] = (time.perf_counter_ns() - start_ns) / 1e6 / BATCH_VERIFY_SAMPLES
+        
+        # The service hashes challenges with hashlib.sha256 (OpenSSL, SHA-NI
+        # where available); time BLAKE3 next to it when the package is present
+        results['hash_ns_per_proof'] = _hash_ns_per_proof(hashlib.sha256)
+        try:
+            import blake3
+            results['blake3_ns_per_proof'] = _hash_ns_per_proof(blake3.blake3)
+        except ImportError:
+            pass
+        
         return results
 
+    def build_metrics_table(self) -> np.ndarray:
+        """Pack the per-method results into a structured array, one row per method"""
+        self.metrics = np.array([
+            (
+                self.results[key]['latency_ms'],
+                self.results[key]['server_storage_bytes'],
+                self.results[key]['network_bytes'],
+                self.results[key]['privacy_score'],
+                self.results[key]['crypto_strength_bits'],
+            )
+            for key in _METHOD_KEYS
+        ], dtype=_METRICS_DTYPE)
+        return self.metrics
+    
     def generate_all_graphs(self):
         """Generate all 5 comparison graphs"""
         print("\n📈 Generating Performance Comparison Graphs...")
         
+        # Set style for better looking graphs; done here rather than at import
+        # so measurement-only callers don't pay for it
+        plt.style.use('seaborn-v0_8')
+        try:
+            import seaborn as sns
+            sns.set_palette("husl")
+        except ImportError:
+            pass
+        
+        self.build_metrics_table()
+        
         # Create output directory
-        os.makedirs('performance_graphs', exist_ok=True)
+        out_dir = Path('docs/results')
+        out_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Draw all panels on one canvas so figure setup, layout and font
+        # handling happen once instead of once per graph
+        # Each 2x3 cell is 12x8 inches, the size of the old per-graph figures
+        fig = plt.figure(figsize=(36, 16))
+        panels = [
+            (self.graph_1_latency_comparison, fig.add_subplot(2, 3, 1),
+             out_dir / '1_latency_comparison.png', "📊 Graph 1: Latency Comparison"),
+            (self.graph_2_security_exposure, fig.add_subplot(2, 3, 2),
+             out_dir / '2_security_exposure.png', "🔒 Graph 2: Security Exposure"),
+            (self.graph_3_network_attack_surface, fig.add_subplot(2, 3, 3),
+             out_dir / '3_network_attack_surface.png', "🌐 Graph 3: Network Attack Surface"),
+            (self.graph_4_privacy_preservation, fig.add_subplot(2, 3, 4, projection='polar'),
+             out_dir / '4_privacy_preservation.png', "🕵️ Graph 4: Privacy Preservation"),
+            (self.graph_5_crypto_strength, fig.add_subplot(2, 3, 5),
+             out_dir / '5_crypto_strength.png', "🔐 Graph 5: Cryptographic Strength"),
+        ]
+        
+        for draw, ax, _, _ in panels:
+            draw(ax)
+        
+        # Rasterize the canvas once, then slice each panel out of the pixels
+        fig.set_dpi(GRAPH_DPI)
+        fig.tight_layout()
+        fig.canvas.draw()
+        pixels = np.asarray(fig.canvas.buffer_rgba())
+        height = pixels.shape[0]
+        images = [(out_dir / 'all_comparisons.png', pixels)]
+        
+        renderer = fig.canvas.get_renderer()
+        for _, ax, path, _ in panels:
+            bbox = ax.get_tightbbox(renderer).padded(GRAPH_DPI / 10)
+            x0, x1 = max(int(bbox.x0), 0), min(int(bbox.x1) + 1, pixels.shape[1])
+            y0, y1 = max(int(height - bbox.y1), 0), min(int(height - bbox.y0) + 1, height)
+            images.append((path, pixels[y0:y1, x0:x1]))
+        
+        # PNG compression dominates what is left and Pillow releases the GIL
+        # while encoding, so the images are written from a thread pool
+        with ThreadPoolExecutor(max_workers=len(images)) as executor:
+            list(executor.map(lambda image: plt.imsave(*image, dpi=GRAPH_DPI), images))
+        
+        for _, _, _, label in panels:
+            print(f"{label} - SAVED")
         
-        # Generate each graph
-        self.graph_1_latency_comparison()
-        self.graph_2_security_exposure()
-        self.graph_3_network_attack_surface()
-        self.graph_4_privacy_preservation()
-        self.graph_5_crypto_strength()
+        plt.close(fig)
         
         print("✅ All graphs generated in 'docs/results/' directory")
 
-    def graph_1_latency_comparison(self):
+    def graph_1_latency_comparison(self, ax):
         """Graph 1: Authentication Latency Comparison"""
-        methods = ['ZKP', 'Password+bcrypt', 'OAuth2', 'FIDO2/WebAuthn', 'SMS OTP']
-        latencies = [
-            self.results['zkp']['latency_ms'],
-            self.results['password_bcrypt']['latency_ms'],
-            self.results['oauth2']['latency_ms'],
-            self.results['fido2_webauthn']['latency_ms'],
-            self.results['sms_otp']['latency_ms']
-        ]
+        latencies = self.metrics['lat']
         
-        plt.figure(figsize=(12, 8))
         colors = ['#2E8B57', '#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
-        bars = plt.bar(methods, latencies, color=colors, alpha=0.8, edgecolor='black', linewidth=1)
+        bars = ax.bar(_METHODS, latencies, color=colors, alpha=0.8, edgecolor='black', linewidth=1, log=True)
         
-        plt.title('Authentication Latency Comparison\n(Lower is Better)', fontsize=16, fontweight='bold')
-        plt.ylabel('Response Time (milliseconds)', fontsize=12)
-        plt.xlabel('Authentication Method', fontsize=12)
+        ax.set_title('Authentication Latency Comparison\n(Lower is Better)', fontsize=16, fontweight='bold')
+        ax.set_ylabel('Response Time (milliseconds)', fontsize=12)
+        ax.set_xlabel('Authentication Method', fontsize=12)
         
         # Add value labels on bars
-        for bar, latency in zip(bars, latencies):
-            plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 50,
-                    f'{latency:.0f}ms', ha='center', va='bottom', fontweight='bold')
-        
-        plt.yscale('log')
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('docs/results/1_latency_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.bar_label(bars, labels=[f'{latency:.0f}ms' for latency in latencies], padding=3, fontweight='bold')
         
-        print("📊 Graph 1: Latency Comparison - SAVED")
+        ax.grid(axis='y', alpha=0.3)
 
-    def graph_2_security_exposure(self):
+    def graph_2_security_exposure(self, ax):
         """Graph 2: Server-Side Security Exposure"""
-        methods = ['ZKP', 'Password+bcrypt', 'OAuth2', 'FIDO2/WebAuthn', 'SMS OTP']
-        storage_bytes = [
-            self.results['zkp']['server_storage_bytes'],
-            self.results['password_bcrypt']['server_storage_bytes'],
-            self.results['oauth2']['server_storage_bytes'],
-            self.results['fido2_webauthn']['server_storage_bytes'],
-            self.results['sms_otp']['server_storage_bytes']
-        ]
+        storage_bytes = self.metrics['storage']
         
         # Categorize as critical vs non-critical
         critical_data = [0, 128, 500, 0, 64]  # ZKP and FIDO2 store no critical secrets
         non_critical_data = [65, 0, 0, 256, 0]  # Public keys only
         
-        plt.figure(figsize=(12, 8))
-        x = np.arange(len(methods))
+        x = np.arange(len(_METHODS))
         width = 0.6
         
-        bars1 = plt.bar(x, critical_data, width, label='Critical Secrets (Vulnerable)', 
+        bars1 = ax.bar(x, critical_data, width, label='Critical Secrets (Vulnerable)', 
                        color='#FF4444', alpha=0.8)
-        bars2 = plt.bar(x, non_critical_data, width, bottom=critical_data, 
+        bars2 = ax.bar(x, non_critical_data, width, bottom=critical_data, 
                        label='Public Data (Safe)', color='#44FF44', alpha=0.8)
         
-        plt.title('Server-Side Security Exposure per User\n(Lower Critical Data is Better)', 
-                 fontsize=16, fontweight='bold')
-        plt.ylabel('Data Storage (bytes)', fontsize=12)
-        plt.xlabel('Authentication Method', fontsize=12)
-        plt.xticks(x, methods, rotation=45, ha='right')
+        ax.set_title('Server-Side Security Exposure per User\n(Lower Critical Data is Better)', 
+                     fontsize=16, fontweight='bold')
+        ax.set_ylabel('Data Storage (bytes)', fontsize=12)
+        ax.set_xlabel('Authentication Method', fontsize=12)
+        ax.set_xticks(x)
+        ax.set_xticklabels(_METHODS, rotation=45, ha='right')
         
         # Add value labels
         for i, (crit, non_crit) in enumerate(zip(critical_data, non_critical_data)):
             if crit > 0:
-                plt.text(i, crit/2, f'{crit}B', ha='center', va='center', 
+                ax.text(i, crit/2, f'{crit}B', ha='center', va='center', 
                         fontweight='bold', color='white')
             if non_crit > 0:
-                plt.text(i, crit + non_crit/2, f'{non_crit}B', ha='center', va='center', 
+                ax.text(i, crit + non_crit/2, f'{non_crit}B', ha='center', va='center', 
                         fontweight='bold', color='black')
         
-        plt.legend()
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('docs/results/2_security_exposure.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print("🔒 Graph 2: Security Exposure - SAVED")
+        ax.legend()
+        ax.grid(axis='y', alpha=0.3)
 
-    def graph_3_network_attack_surface(self):
+    def graph_3_network_attack_surface(self, ax):
         """Graph 3: Network Attack Surface"""
-        methods = ['ZKP', 'Password+bcrypt', 'OAuth2', 'FIDO2/WebAuthn', 'SMS OTP']
-        network_bytes = [
-            self.results['zkp']['network_bytes'],
-            self.results['password_bcrypt']['network_bytes'],
-            self.results['oauth2']['network_bytes'],
-            self.results['fido2_webauthn']['network_bytes'],
-            self.results['sms_otp']['network_bytes']
-        ]
+        network_bytes = self.metrics['net']
         
         # Categorize as sensitive vs non-sensitive
         sensitive_data = [0, 200, 1024, 0, 150]  # No sensitive data for ZKP/FIDO2
         non_sensitive_data = [365, 0, 1024, 400, 150]  # Proofs/public data
         
-        plt.figure(figsize=(12, 8))
-        x = np.arange(len(methods))
+        x = np.arange(len(_METHODS))
         width = 0.6
         
-        bars1 = plt.bar(x, sensitive_data, width, label='Sensitive Data (Interceptable)', 
+        bars1 = ax.bar(x, sensitive_data, width, label='Sensitive Data (Interceptable)', 
                        color='#FF6B6B', alpha=0.8)
-        bars2 = plt.bar(x, non_sensitive_data, width, bottom=sensitive_data, 
+        bars2 = ax.bar(x, non_sensitive_data, width, bottom=sensitive_data, 
                        label='Public/Proof Data (Safe)', color='#4ECDC4', alpha=0.8)
         
-        plt.title('Network Attack Surface per Authentication\n(Lower Sensitive Data is Better)', 
-                 fontsize=16, fontweight='bold')
-        plt.ylabel('Data Transmitted (bytes)', fontsize=12)
-        plt.xlabel('Authentication Method', fontsize=12)
-        plt.xticks(x, methods, rotation=45, ha='right')
+        ax.set_title('Network Attack Surface per Authentication\n(Lower Sensitive Data is Better)', 
+                     fontsize=16, fontweight='bold')
+        ax.set_ylabel('Data Transmitted (bytes)', fontsize=12)
+        ax.set_xlabel('Authentication Method', fontsize=12)
+        ax.set_xticks(x)
+        ax.set_xticklabels(_METHODS, rotation=45, ha='right')
         
         # Add value labels
         for i, (sens, non_sens) in enumerate(zip(sensitive_data, non_sensitive_data)):
             if sens > 0:
-                plt.text(i, sens/2, f'{sens}B', ha='center', va='center', 
+                ax.text(i, sens/2, f'{sens}B', ha='center', va='center', 
                         fontweight='bold', color='white')
             if non_sens > 0:
-                plt.text(i, sens + non_sens/2, f'{non_sens}B', ha='center', va='center', 
+                ax.text(i, sens + non_sens/2, f'{non_sens}B', ha='center', va='center', 
                         fontweight='bold', color='black')
         
-        plt.legend()
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('docs/results/3_network_attack_surface.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print("🌐 Graph 3: Network Attack Surface - SAVED")
+        ax.legend()
+        ax.grid(axis='y', alpha=0.3)
 
-    def graph_4_privacy_preservation(self):
+    def graph_4_privacy_preservation(self, ax):
         """Graph 4: Privacy Preservation Score (Radar Chart)"""
-        categories = ['Secrets\nRevealed', 'Third-party\nDependency', 'User\nControl', 'Data\nPermanence']
-        
-        # Privacy scores (0-10, 10 being best privacy)
-        zkp_scores = [10, 10, 10, 10]  # Perfect privacy
-        password_scores = [3, 8, 6, 4]  # Passwords revealed, stored permanently
-        oauth_scores = [2, 1, 3, 3]  # Third-party sees everything
-        fido_scores = [8, 9, 8, 7]  # Hardware-based, good privacy
-        sms_scores = [1, 2, 4, 2]  # Phone numbers, SMS interception
-        
-        # Set up radar chart
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False)
-        angles = np.concatenate((angles, [angles[0]]))  # Complete the circle
-        
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
-        
-        # Plot each method
-        methods_data = [
-            ('ZKP (Ours)', zkp_scores, '#2E8B57'),
-            ('Password+bcrypt', password_scores, '#FF6B6B'),
-            ('OAuth2', oauth_scores, '#4ECDC4'),
-            ('FIDO2/WebAuthn', fido_scores, '#45B7D1'),
-            ('SMS OTP', sms_scores, '#FFA07A')
-        ]
-        
-        for name, scores, color in methods_data:
-            scores_circle = scores + [scores[0]]  # Complete the circle
-            ax.plot(angles, scores_circle, 'o-', linewidth=2, label=name, color=color)
-            ax.fill(angles, scores_circle, alpha=0.25, color=color)
+        for (name, color), scores in zip(_RADAR_SERIES, _RADAR_SCORES):
+            ax.plot(_RADAR_ANGLES, scores, 'o-', linewidth=2, label=name, color=color)
+            ax.fill(_RADAR_ANGLES, scores, alpha=0.25, color=color, rasterized=True)
         
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories)
+        ax.set_xticks(_RADAR_ANGLES[:-1])
+        ax.set_xticklabels(_RADAR_CATEGORIES)
         ax.set_ylim(0, 10)
         ax.set_yticks([2, 4, 6, 8, 10])
         ax.set_yticklabels(['2', '4', '6', '8', '10 (Best)'])
         ax.grid(True)
         
-        plt.title('Privacy Preservation Comparison\n(Higher Values = Better Privacy)', 
-                 fontsize=16, fontweight='bold', pad=20)
-        plt.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
-        plt.tight_layout()
-        plt.savefig('docs/results/4_privacy_preservation.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print("🕵️ Graph 4: Privacy Preservation - SAVED")
+        ax.set_title('Privacy Preservation Comparison\n(Higher Values = Better Privacy)', 
+                     fontsize=16, fontweight='bold', pad=20)
+        ax.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
 
-    def graph_5_crypto_strength(self):
+    def graph_5_crypto_strength(self, ax):
         """Graph 5: Cryptographic Proof Strength (Log Scale)"""
-        methods = ['ZKP', 'Password+bcrypt', 'OAuth2', 'FIDO2/WebAuthn', 'SMS OTP']
-        strength_bits = [
-            self.results['zkp']['crypto_strength_bits'],
-            self.results['password_bcrypt']['crypto_strength_bits'],
-            self.results['oauth2']['crypto_strength_bits'],
-            self.results['fido2_webauthn']['crypto_strength_bits'],
-            self.results['sms_otp']['crypto_strength_bits']
-        ]
+        strength_bits = self.metrics['bits']
         
         # Convert to attack probability (2^-bits)
-        attack_prob = [2**(-bits) for bits in strength_bits]
+        attack_prob = np.exp2(-strength_bits)
         
-        plt.figure(figsize=(12, 8))
         colors = ['#2E8B57', '#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
-        bars = plt.bar(methods, attack_prob, color=colors, alpha=0.8, edgecolor='black', linewidth=1)
+        bars = ax.bar(_METHODS, attack_prob, color=colors, alpha=0.8, edgecolor='black', linewidth=1, log=True)
         
-        plt.title('Cryptographic Strength Comparison\n(Attack Success Probability - Lower is Better)', 
-                 fontsize=16, fontweight='bold')
-        plt.ylabel('Attack Success Probability', fontsize=12)
-        plt.xlabel('Authentication Method', fontsize=12)
-        plt.yscale('log')
+        ax.set_title('Cryptographic Strength Comparison\n(Attack Success Probability - Lower is Better)', 
+                     fontsize=16, fontweight='bold')
+        ax.set_ylabel('Attack Success Probability', fontsize=12)
+        ax.set_xlabel('Authentication Method', fontsize=12)
         
         # Add value labels
-        for bar, bits, prob in zip(bars, strength_bits, attack_prob):
-            plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() * 10,
-                    f'{bits}-bit\n(2^-{bits})', ha='center', va='bottom', fontweight='bold')
+        ax.bar_label(bars, labels=_STRENGTH_LABELS, padding=3, fontweight='bold')
+        # Leave headroom so the tallest bar's label clears the title
+        ax.margins(y=0.1)
         
-        plt.grid(axis='y', alpha=0.3)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig('docs/results/5_crypto_strength.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print("🔐 Graph 5: Cryptographic Strength - SAVED")
+        ax.grid(axis='y', alpha=0.3)
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
     def print_research_references(self):
         """Print all research paper references"""
         print("\n📚 Research Paper References:")
         print("=" * 50)
         
-        references = [
-            {
-                'title': 'The Science of Guessing: Analyzing an Anonymized Corpus of 70 Million Passwords',
-                'authors': 'Bonneau, J., Herley, C., Van Oorschot, P. C., & Stajano, F.',
-                'venue': 'IEEE Symposium on Security and Privacy (2012)',
-                'link': 'https://doi.org/10.1109/SP.2012.49',
-                'used_for': 'Password authentication latency and security analysis'
-            },
-            {
-                'title': 'Is FIDO2 the Kingslayer of User Authentication? A Comparative Usability Study',
-                'authors': 'Lyastani, S. G., Schilling, M., Neumayr, M., Backes, M., & Bugiel, S.',
-                'venue': 'ACM Conference on Computer and Communications Security (2020)',
-                'link': 'https://doi.org/10.1145/3372297.3417292',
-                'used_for': 'FIDO2/WebAuthn and OAuth2 performance metrics'
-            },
-            {
-                'title': 'Multi-Factor Authentication: A Survey',
-                'authors': 'Ometov, A., Bezzateev, S., Mäkitalo, N., Andreev, S., Mikkonen, T., & Koucheryavy, Y.',
-                'venue': 'Sensors Journal (2021)',
-                'link': 'https://doi.org/10.3390/s18051283',
-                'used_for': 'SMS OTP and privacy scoring methodology'
-            },
-            {
-                'title': 'Digital Identity Guidelines',
-                'authors': 'Grassi, P. A., Garcia, M. E., & Fenton, J. L.',
-                'venue': 'NIST Special Publication 800-63-3 (2017)',
-                'link': 'https://doi.org/10.6028/NIST.SP.800-63-3',
-                'used_for': 'Authentication security requirements and strength analysis'
-            }
-        ]
-        
-        for i, ref in enumerate(references, 1):
-            print(f"\n[{i}] {ref['title']}")
-            print(f"    Authors: {ref['authors']}")
-            print(f"    Venue: {ref['venue']}")
-            print(f"    Link: {ref['link']}")
-            print(f"    Used for: {ref['used_for']}")
+        for i, ref in enumerate(_REFERENCES, 1):
+            print(
+                f"\n[{i}] {ref.title}\n"
+                f"    Authors: {ref.authors}\n"
+                f"    Venue: {ref.venue}\n"
+                f"    Link: {ref.link}\n"
+                f"    Used for: {ref.used_for}"
+            )
 
 def main():
+    _quiet_service_logs()
+    
     analyzer = PerformanceAnalyzer()
     
     print("🔐 ZKP Authentication Performance Analysis")
@@ -409,10 +553,18 @@ def main():
     
     print(f"✅ ZKP Measurements Complete:")
     print(f"   • Latency: {zkp_results['latency_ms']:.2f}ms")
+    if 'cold_latency_ms' in zkp_results:
+        print(f"   • Cold Latency (first proof): {zkp_results['cold_latency_ms']:.2f}ms")
     print(f"   • Storage: {zkp_results['server_storage_bytes']} bytes")
     print(f"   • Network: {zkp_results['network_bytes']} bytes")
     print(f"   • Privacy Score: {zkp_results['privacy_score']}/10")
     print(f"   • Crypto Strength: {zkp_results['crypto_strength_bits']} bits")
+    if 'batch_verify_ms_per_proof' in zkp_results:
+        print(f"   • Batch Verify: {zkp_results['batch_verify_ms_per_proof']:.2f}ms per proof")
+    if 'hash_ns_per_proof' in zkp_results:
+        print(f"   • Challenge Hash (SHA-256): {zkp_results['hash_ns_per_proof']:.0f}ns")
+    if 'blake3_ns_per_proof' in zkp_results:
+        print(f"   • Challenge Hash (BLAKE3): {zkp_results['blake3_ns_per_proof']:.0f}ns")
     
     print("\n📚 Research Baselines Loaded:")
     for method, data in analyzer.research_data.items():
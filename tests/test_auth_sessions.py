@@ -0,0 +1,160 @@
+"""
+Tests for session-bound and timestamp-bound ZKP login proofs.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import (
+    AuthenticationFailedException,
+    RateLimitExceededException,
+    ZKPVerificationFailedException
+)
+from app.main import app
+from app.services.auth import (
+    AuthService,
+    AUTH_MESSAGE_MAX_AGE_SECONDS,
+    MAX_SESSION_IDS_PER_USER,
+    SESSION_ID_TTL_SECONDS,
+    auth_service
+)
+from app.services.zkp import zkp_service
+
+
+class FakeDatabase:
+    """Stands in for AsyncSession; every lookup finds `user`."""
+
+    def __init__(self, user):
+        self.user = user
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalar_one_or_none=lambda: self.user)
+
+
+@pytest.fixture
+def service():
+    return AuthService()
+
+
+@pytest.fixture(scope="module")
+def keypair():
+    return zkp_service.generate_keypair()
+
+
+@pytest.fixture
+def alice(keypair):
+    return SimpleNamespace(
+        id=1,
+        username="alice",
+        email="alice@example.com",
+        public_key=keypair.public_key_hex,
+        is_active=True
+    )
+
+
+def _proof(keypair, message: str) -> dict:
+    proof = zkp_service.create_proof(keypair.private_key, message, public_key=keypair.public_key)
+    return {
+        "commitment_x": proof.commitment_x,
+        "commitment_y": proof.commitment_y,
+        "response": proof.response,
+        "challenge": proof.challenge,
+        "message": proof.message
+    }
+
+
+def _login(service, user, identifier: str, proof: dict):
+    return asyncio.run(service.authenticate_user(FakeDatabase(user), identifier, proof))
+
+
+@pytest.mark.unit
+def test_session_id_is_single_use(service, alice, keypair):
+    session_id = service.issue_session_id("alice")
+    proof = _proof(keypair, zkp_service.create_session_message("alice", session_id))
+
+    assert _login(service, alice, "alice", proof) is alice
+    with pytest.raises(ZKPVerificationFailedException):
+        _login(service, alice, "alice", proof)
+
+
+@pytest.mark.unit
+def test_session_id_is_bound_to_its_username(service, alice, keypair):
+    session_id = service.issue_session_id("bob")
+    proof = _proof(keypair, zkp_service.create_session_message("alice", session_id))
+
+    with pytest.raises(ZKPVerificationFailedException):
+        _login(service, alice, "alice", proof)
+
+    # The failed attempt does not use up bob's id
+    assert service.consume_session_id(zkp_service.create_session_message("bob", session_id), "bob")
+
+
+@pytest.mark.unit
+def test_expired_session_id_is_rejected(service, monkeypatch):
+    session_id = service.issue_session_id("alice")
+
+    later = time.time() + SESSION_ID_TTL_SECONDS + 1
+    monkeypatch.setattr(time, "time", lambda: later)
+
+    assert not service.consume_session_id(zkp_service.create_session_message("alice", session_id), "alice")
+
+
+@pytest.mark.unit
+def test_session_ids_are_capped_per_username(service):
+    for _ in range(MAX_SESSION_IDS_PER_USER):
+        service.issue_session_id("alice")
+
+    with pytest.raises(RateLimitExceededException):
+        service.issue_session_id("alice")
+
+    # Other users are unaffected
+    assert service.issue_session_id("bob")
+
+
+@pytest.mark.unit
+def test_fresh_timestamp_proof_is_accepted(service, alice, keypair):
+    proof = _proof(keypair, zkp_service.create_authentication_message("alice", int(time.time())))
+    assert _login(service, alice, "alice", proof) is alice
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("message", [
+    f"ZKP_AUTH:alice:{int(time.time()) - AUTH_MESSAGE_MAX_AGE_SECONDS - 60}",
+    f"ZKP_AUTH:alice:{int(time.time()) + 3600}",
+    f"ZKP_AUTH:bob:{int(time.time())}",
+    "hello",
+])
+def test_stale_or_unbound_proof_is_rejected(service, alice, keypair, message):
+    with pytest.raises(ZKPVerificationFailedException):
+        _login(service, alice, "alice", _proof(keypair, message))
+
+
+@pytest.mark.unit
+def test_rejected_registration_keeps_session_id(service, alice, keypair):
+    session_id = service.issue_session_id("alice")
+    message = zkp_service.create_session_message("alice", session_id)
+
+    with pytest.raises(AuthenticationFailedException):
+        asyncio.run(service.create_user(
+            FakeDatabase(alice), "alice", "alice@example.com", keypair.public_key_hex, _proof(keypair, message)
+        ))
+
+    assert service.consume_session_id(message, "alice")
+
+
+@pytest.mark.unit
+def test_session_endpoint_returns_429_past_cap(monkeypatch):
+    monkeypatch.setattr(auth_service, "_session_ids", {})
+    monkeypatch.setattr(auth_service, "_session_ids_per_user", {})
+    client = TestClient(app)
+
+    statuses = [
+        client.get("/api/auth/session/new", params={"username": "carol"}).status_code
+        for _ in range(MAX_SESSION_IDS_PER_USER + 1)
+    ]
+
+    assert statuses == [200] * MAX_SESSION_IDS_PER_USER + [429]
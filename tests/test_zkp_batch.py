@@ -0,0 +1,158 @@
+"""
+Tests for batched Schnorr verification and precomputed commitments.
+"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.zkp import (
+    ZKPProofData,
+    ZKPService,
+    MAX_PRECOMPUTED_COMMITMENTS_PER_CALLER,
+    PRECOMPUTED_COMMITMENT_TTL_SECONDS,
+    zkp_service
+)
+
+
+@pytest.fixture(scope="module")
+def service():
+    return ZKPService()
+
+
+@pytest.fixture(scope="module")
+def signed_batch(service):
+    """64 valid proofs, each from its own key pair, with their hex public keys."""
+    proofs = []
+    public_keys = []
+    for i in range(64):
+        keypair = service.generate_keypair()
+        message = service.create_authentication_message(f"user{i}", int(time.time()))
+        proofs.append(service.create_proof(keypair.private_key, message, public_key=keypair.public_key))
+        public_keys.append(keypair.public_key_hex)
+    return proofs, public_keys
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Start every test with an empty commitment pool on the shared service
+    monkeypatch.setattr(zkp_service, "_precomputed", {})
+    monkeypatch.setattr(zkp_service, "_precomputed_per_caller", {})
+    return TestClient(app)
+
+
+def _tampered(proof: ZKPProofData) -> ZKPProofData:
+    return ZKPProofData(
+        commitment_x=proof.commitment_x,
+        commitment_y=proof.commitment_y,
+        response=hex(int(proof.response, 16) + 1),
+        challenge=proof.challenge,
+        message=proof.message
+    )
+
+
+def _proof_json(proof: ZKPProofData) -> dict:
+    return {
+        "commitment_x": proof.commitment_x,
+        "commitment_y": proof.commitment_y,
+        "response": proof.response,
+        "challenge": proof.challenge,
+        "message": proof.message
+    }
+
+
+@pytest.mark.unit
+def test_batch_of_valid_proofs_passes(service, signed_batch):
+    proofs, public_keys = signed_batch
+    assert service.batch_verify_proofs(proofs, public_keys)
+
+
+@pytest.mark.unit
+def test_batch_with_tampered_response_fails(service, signed_batch):
+    proofs, public_keys = signed_batch
+    proofs = list(proofs)
+    proofs[17] = _tampered(proofs[17])
+    assert not service.batch_verify_proofs(proofs, public_keys)
+
+
+@pytest.mark.unit
+def test_batch_with_wrong_public_key_fails(service, signed_batch):
+    proofs, public_keys = signed_batch
+    public_keys = list(public_keys)
+    public_keys[3] = service.generate_keypair().public_key_hex
+    assert not service.batch_verify_proofs(proofs, public_keys)
+
+
+@pytest.mark.unit
+def test_batch_with_mismatched_lengths_raises(service, signed_batch):
+    proofs, public_keys = signed_batch
+    with pytest.raises(ValueError):
+        service.batch_verify_proofs(proofs, public_keys[:-1])
+
+
+@pytest.mark.unit
+def test_verify_proof_batch_endpoint_flags_invalid_proof(client, signed_batch):
+    proofs, public_keys = signed_batch
+    items = [
+        {"zkp_proof": _proof_json(proof), "public_key": public_key, "username": f"user{i}"}
+        for i, (proof, public_key) in enumerate(zip(proofs[:4], public_keys[:4]))
+    ]
+    items[2]["zkp_proof"] = _proof_json(_tampered(proofs[2]))
+
+    response = client.post("/api/auth/utils/verify-proof-batch", json=items)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["valid"] is False
+    assert [result["valid"] for result in data["results"]] == [True, True, False, True]
+
+
+@pytest.mark.unit
+def test_commitment_id_is_single_use(client):
+    keypair = zkp_service.generate_keypair()
+    commitments = client.post("/api/auth/utils/precompute-commitments", json={"count": 1}).json()["data"]["commitments"]
+    request = {
+        "username": "alice",
+        "private_key": hex(keypair.private_key),
+        "commitment_id": commitments[0]["commitment_id"]
+    }
+
+    first = client.post("/api/auth/utils/generate-proof", json=request)
+    second = client.post("/api/auth/utils/generate-proof", json=request)
+
+    assert first.status_code == 200
+    assert first.json()["data"]["zkp_proof"]["commitment_x"] == commitments[0]["commitment_x"]
+    assert second.status_code == 400
+
+
+@pytest.mark.unit
+def test_expired_commitment_id_is_rejected(client, monkeypatch):
+    keypair = zkp_service.generate_keypair()
+    commitments = client.post("/api/auth/utils/precompute-commitments", json={"count": 1}).json()["data"]["commitments"]
+
+    later = time.time() + PRECOMPUTED_COMMITMENT_TTL_SECONDS + 1
+    monkeypatch.setattr(time, "time", lambda: later)
+    response = client.post("/api/auth/utils/generate-proof", json={
+        "username": "alice",
+        "private_key": hex(keypair.private_key),
+        "commitment_id": commitments[0]["commitment_id"]
+    })
+
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_precompute_commitments_is_capped_per_caller(client):
+    statuses = [
+        client.post("/api/auth/utils/precompute-commitments", json={"count": 32}).status_code
+        for _ in range(MAX_PRECOMPUTED_COMMITMENTS_PER_CALLER // 32)
+    ]
+    over = client.post("/api/auth/utils/precompute-commitments", json={"count": 1})
+
+    assert statuses == [200] * len(statuses)
+    assert over.status_code == 429
+
+    # Another caller's commitments are left alone
+    assert zkp_service.precompute_commitments(1, "other-client")